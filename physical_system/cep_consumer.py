@@ -18,7 +18,7 @@ class CEPConsumer(Thread):
     """
 
     def __init__(self, gpio_queue, mcp_queue, nfc_queue, fsm_map, data_logger,
-                 config, simulation=False):
+                 config, simulation=False, wake_event=None):
         """
         Initialize CEP Consumer
 
@@ -29,6 +29,7 @@ class CEPConsumer(Thread):
         data_logger: DataLogger instance for logging matched events
         config: System configuration
         simulation: Simulation mode flag
+        wake_event: Event set by producers when they enqueue (wakes the loop)
         """
         super().__init__(daemon=True, name="CEPConsumer")
 
@@ -58,6 +59,10 @@ class CEPConsumer(Thread):
         self.running = False
         self.stop_event = Event()
 
+        # Producers set this after enqueueing, so the loop wakes when
+        # there is work instead of polling on a timer
+        self.wake_event = wake_event if wake_event is not None else Event()
+
         # Statistics
         self.stats = {
             'fused_events': 0,
@@ -77,6 +82,11 @@ class CEPConsumer(Thread):
 
         while self.running and not self.stop_event.is_set():
             try:
+                # Block until a producer signals work (500ms fallback tick
+                # so expiry of pending events still fires)
+                self.wake_event.wait(timeout=0.5)
+                self.wake_event.clear()
+
                 # Step 1: Consume events from queues
                 self._consume_events()
 
@@ -86,9 +96,6 @@ class CEPConsumer(Thread):
                 # Step 3: Expire old events
                 self._expire_events()
 
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.01)  # 10ms loop
-
             except Exception as e:
                 self.logger.error(f"Error in CEP loop: {e}", exc_info=True)
                 time.sleep(0.1)
@@ -330,6 +337,7 @@ class CEPConsumer(Thread):
         self.logger.info("Stopping CEP Consumer...")
         self.running = False
         self.stop_event.set()
+        self.wake_event.set()  # Unblock the loop immediately
 
     def get_statistics(self):
         """Get current statistics"""
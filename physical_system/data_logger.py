@@ -6,14 +6,22 @@ Event format: {timestamp, part_id, station_id, activity}
 
 """
 
+import atexit
+import array
+import collections
 import logging
-import csv
 import os
-from datetime import datetime
-from threading import Lock
+from threading import Lock, Thread, Event
 import time
 
 
+def _csv_field(value):
+    """Quote a field only if it actually needs it (fields normally don't)"""
+    if ',' in value or '"' in value or '\n' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
 class DataLogger:
     """
     Logs system events and calculates KPIs
@@ -22,6 +30,20 @@ class DataLogger:
         Time | Station ID | Part ID | Activity
     """
 
+    # Fixed attribute layout: hot fields written per event first (queue,
+    # timestamp cache, KPI state), then the flusher-owned I/O fields, then
+    # configuration that is only touched at startup/shutdown
+    __slots__ = (
+        '_queue', '_queue_append', '_mid_cache', '_mid_get',
+        '_tail_cache', '_tail_get', '_kpi', '_kpi_idx', 'lock',
+        'station_entry_times', 'current_wip', 'max_wip',
+        'cycle_times_s1', 'cycle_times_s2',
+        'station_states', 'corner_states', 'event_timestamps',
+        '_fd', '_buf', '_buf_len', '_flush_lock',
+        '_stop_event', '_flush_thread', 'flush_interval',
+        'logger', 'log_file', 'system_start_time', 'influx_writer',
+    )
+
     def __init__(self, log_file="data/events.csv"):
         """
         Initialize data logger
@@ -35,20 +57,63 @@ class DataLogger:
         # Create data directory if needed or do nothing if it exists
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
 
-        # Create CSV file with headers if it doesn't exist
+        # Create CSV file with headers if it doesn't exist; an existing
+        # log in the old formatted-Time schema is rotated aside first so
+        # Epoch_ns rows never end up under the old header
         if not os.path.exists(log_file):
             self._create_csv()
+        elif self._is_legacy_format():
+            self._rotate_legacy_csv()
+            self._create_csv()
+
+        # Raw append-mode descriptor; rows are written as pre-encoded bytes,
+        # skipping the TextIOWrapper/codec layers entirely. O_APPEND makes
+        # each os.write an atomic kernel-serialized append, so no userspace
+        # lock is needed around the write path
+        self._fd = os.open(
+            log_file,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC,
+            0o644
+        )
+
+        # One preallocated write buffer, reused for every batch so the
+        # flusher never reallocates; _buf_len tracks the fill level.
+        # The flush lock serializes drains (flusher thread vs force_flush)
+        # without ever being touched by producers
+        self._buf = bytearray(262144)
+        self._buf_len = 0
+        self._flush_lock = Lock()
+
+        # Pending rows are queued here and drained by the flusher thread,
+        # so log_event never blocks on file I/O
+        self._queue = collections.deque()
+
+        # Pre-encoded row fragments: the set of (station, activity) pairs
+        # is tiny, so the constant substrings are encoded once and reused
+        self._mid_cache = {}   # station_id -> b",S1,"
+        self._tail_cache = {}  # (activity, tag) -> b",ENTER,START\n"
+
+        # Pre-bound callables for the hot path, so log_event skips the
+        # repeated attribute lookups per event
+        self._queue_append = self._queue.append
+        self._mid_get = self._mid_cache.get
+        self._tail_get = self._tail_cache.get
+        self.flush_interval = 0.25  # seconds between batch writes
+        self._stop_event = Event()
+        self._flush_thread = Thread(target=self._flusher, daemon=True, name="LogFlusher")
+        self._flush_thread.start()
+
+        # Make sure buffered rows reach disk on interpreter exit
+        atexit.register(self.close)
 
         self.logger.info(f"Data logger initialized: {log_file}")
 
-        # KPI tracking initialization as a dictionary
-        self.kpis = {
-            'total_parts': 0,
-            'station1_count': 0,
-            'station2_count': 0,
-            'total_process_time': 0,
-            'total_queue_time': 0
-        }
+        # KPI counters as a flat array of unsigned ints
+        # (one contiguous buffer, fixed indices, no hash lookup per increment)
+        # Indices: 0=total_parts, 1=station1_count, 2=station2_count,
+        #          3=total_process_time, 4=total_queue_time
+        self._kpi = array.array('Q', [0] * 5)
+        self._kpi_idx = {'S1': 1, 'S2': 2}
 
         self.system_start_time = time.time()
         self.station_entry_times = {}
@@ -77,11 +142,55 @@ class DataLogger:
     def _create_csv(self):
         """Create CSV file with headers"""
         with open(self.log_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Time', 'Station ID', 'Part ID', 'Activity', 'Tag'])
+            f.write('Epoch_ns,Station ID,Part ID,Activity,Tag\n')
         self.logger.info("Created new event log file")
 
-    def log_event(self, part_id, station_id, activity, tag=None):
+    def _is_legacy_format(self):
+        """Check whether the existing log still uses the old Time header"""
+        with open(self.log_file, 'r', newline='') as f:
+            header = f.readline()
+        return header.startswith('Time,')
+
+    def _rotate_legacy_csv(self):
+        """Move an old-format log aside so a fresh Epoch_ns file can start"""
+        root, ext = os.path.splitext(self.log_file)
+        sidecar = f"{root}_legacy{ext}"
+        if os.path.exists(sidecar):
+            sidecar = f"{root}_legacy_{int(time.time())}{ext}"
+        os.rename(self.log_file, sidecar)
+        self.logger.info(f"Rotated old-format event log to {sidecar}")
+
+    def to_readable_csv(self, dest_file=None):
+        """
+        Write a copy of the event log with formatted timestamps
+
+        dest_file: Output path (defaults to <log_file>_readable.csv)
+
+        Returns: Path of the readable copy
+        """
+        if dest_file is None:
+            root, ext = os.path.splitext(self.log_file)
+            dest_file = f"{root}_readable{ext}"
+
+        with open(self.log_file, 'r', newline='') as src, \
+                open(dest_file, 'w', newline='') as dst:
+            src.readline()  # Skip raw header
+            dst.write('Time,Station ID,Part ID,Activity,Tag\n')
+            for line in src:
+                ts, _, rest = line.partition(',')
+                try:
+                    ns = int(ts)
+                except ValueError:
+                    # Already-formatted row (pre-Epoch_ns log), pass through
+                    dst.write(line)
+                    continue
+                stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ns // 1_000_000_000))
+                millis = ns % 1_000_000_000 // 1_000_000
+                dst.write(f"{stamp}.{millis:03d},{rest}")
+
+        return dest_file
+
+    def log_event(self, part_id, station_id, activity, tag=None, part=None):
         """
         Log an event with START/FINISH tag
             part_id: Part ID (e.g., "P001", "04a1b2c3d4e5f6")
@@ -92,24 +201,44 @@ class DataLogger:
 
             tag: Event tag - "START" or "FINISH" (auto-inferred if None)
 
+            part: Optional tracked Part object; its event history is
+                  updated here so callers don't need a second call
+
         """
-        # Get current timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        current_time = time.time()
+        # Integer nanosecond timestamp - no string formatting in the hot
+        # path, to_readable_csv() converts for human consumption
+        timestamp = time.time_ns()
+        current_time = timestamp / 1e9
 
         # Auto-infer tag if not provided
         if tag is None:
             tag = self._infer_tag(activity)
 
+        # Assemble the row from cached fragments; only the timestamp and
+        # part ID are encoded per event
+        mid = self._mid_get(station_id)
+        if mid is None:
+            mid = f",{_csv_field(station_id)},".encode()
+            self._mid_cache[station_id] = mid
+        tail = self._tail_get((activity, tag))
+        if tail is None:
+            tail = f",{_csv_field(activity)},{tag}\n".encode()
+            self._tail_cache[(activity, tag)] = tail
+        row = b"%d" % timestamp + mid + _csv_field(part_id).encode() + tail
+
+        # Queue the row for the flusher thread (deque.append is atomic under
+        # the GIL, so producers need no lock here)
+        self._queue_append(row)
+
+        # Update the tracked part's history in the same call
+        if part is not None:
+            part.add_event(station_id, activity, current_time)
+
+        # Log to console (the logging formatter supplies the wall-clock time)
+        self.logger.info(f"Event: {station_id} | {part_id} | {activity}")
+
+        # Lock only guards the shared KPI/metric state
         with self.lock:
-            # Write to CSV with tag
-            with open(self.log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([timestamp, station_id, part_id, activity, tag])
-
-            # Log to console
-            self.logger.info(f"Event: {timestamp} | {station_id} | {part_id} | {activity}")
-
             # Update KPIs
             self._update_kpis(station_id, activity)
 
@@ -129,6 +258,63 @@ class DataLogger:
                     additional_fields={'cycle_time': cycle_time} if cycle_time else None
                 )
 
+    def _flusher(self):
+        """Background thread, drains queued rows in one batched write per interval"""
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self._drain_queue()
+            except Exception as e:
+                # Keep the thread alive (e.g. transient ENOSPC / read-only
+                # SD card) and retry the queued rows next interval
+                self.logger.error(f"Error flushing event log: {e}")
+                time.sleep(1)
+
+    def _drain_queue(self):
+        """Copy all pending pre-encoded rows into the buffer and write it out"""
+        with self._flush_lock:
+            try:
+                while True:
+                    # popleft is atomic; raises IndexError when drained
+                    row = self._queue.popleft()
+                    end = self._buf_len + len(row)
+                    if end > len(self._buf):
+                        self._write_buf()
+                        end = len(row)
+                    self._buf[end - len(row):end] = row
+                    self._buf_len = end
+            except IndexError:
+                pass
+            self._write_buf()
+
+    def _write_buf(self):
+        """Write the filled part of the buffer with one os.write"""
+        if self._buf_len:
+            os.write(self._fd, memoryview(self._buf)[:self._buf_len])
+            self._buf_len = 0
+
+    def force_flush(self):
+        """
+        Push all queued rows to the file immediately
+
+        For shutdown and diagnostics only - the hot path never flushes,
+        the flusher thread writes on its own interval. Safe to call from
+        any thread: the flush lock serializes the drain against the
+        flusher, producers only ever append to the queue, and O_APPEND
+        appends are serialized by the kernel.
+        """
+        self._drain_queue()
+
+    def close(self):
+        """Stop the flusher, drain remaining rows and close the log file"""
+        if self._fd is None:
+            return
+        self._stop_event.set()
+        self._flush_thread.join(timeout=2)
+        self.force_flush()
+        os.fsync(self._fd)
+        os.close(self._fd)
+        self._fd = None
+
     def _infer_tag(self, activity):
         """
         Automatically infer START/FINISH tag from activity name
@@ -150,11 +336,10 @@ class DataLogger:
     def _update_kpis(self, station_id, activity):
         """Update KPI counters"""
         if activity == "EXIT":
-            self.kpis['total_parts'] += 1
-            if station_id == "S1":
-                self.kpis['station1_count'] += 1
-            elif station_id == "S2":
-                self.kpis['station2_count'] += 1
+            self._kpi[0] += 1
+            i = self._kpi_idx.get(station_id)
+            if i:
+                self._kpi[i] += 1
 
     def _update_realtime_metrics(self, part_id, station_id, activity, current_time):
         """Update real-time metrics for Grafana"""
@@ -230,7 +415,7 @@ class DataLogger:
 
             throughput = 0
             if runtime > 60:
-                parts_completed = self.kpis['total_parts']
+                parts_completed = self._kpi[0]
                 throughput = (parts_completed / runtime) * 3600
 
             def get_utilization(station_id):
@@ -257,9 +442,9 @@ class DataLogger:
             event_rate = len(self.event_timestamps) / (min(runtime, 3600) / 60) if runtime > 0 else 0
 
             return {
-                'total_parts': self.kpis['total_parts'],
-                'station1_count': self.kpis['station1_count'],
-                'station2_count': self.kpis['station2_count'],
+                'total_parts': self._kpi[0],
+                'station1_count': self._kpi[1],
+                'station2_count': self._kpi[2],
                 'throughput_per_hour': throughput,
                 'avg_cycle_time_s1': avg_cycle_s1,
                 'avg_cycle_time_s2': avg_cycle_s2,
@@ -27,7 +27,8 @@ class NFCReaderThread(Thread):
     Continuously polls for NFC tags and puts results in queue
     """
 
-    def __init__(self, reader_num, station_id, nfc_queue, simulation=False):
+    def __init__(self, reader_num, station_id, nfc_queue, simulation=False,
+                 wake_event=None):
         """
         Initialize NFC reader thread
 
@@ -35,6 +36,7 @@ class NFCReaderThread(Thread):
         station_id: Station ID (1 or 2)
         nfc_queue: Queue to put NFC events into
         simulation: Run without hardware
+        wake_event: Event to set after enqueueing (wakes the consumer)
         """
         # Thread setup
         super().__init__(daemon=True, name=f"NFC{reader_num}")
@@ -43,6 +45,7 @@ class NFCReaderThread(Thread):
         self.reader_num = reader_num
         self.station_id = station_id
         self.nfc_queue = nfc_queue
+        self.wake_event = wake_event
         self.simulation = simulation or not HARDWARE_AVAILABLE
         
         # Thread control
@@ -116,6 +119,8 @@ class NFCReaderThread(Thread):
                     # Put in queue
                     try:
                         self.nfc_queue.put_nowait(event) # Non-blocking put to avoid blocking producer thread
+                        if self.wake_event:
+                            self.wake_event.set()
                         self.logger.info(f"NFC read: Station {self.station_id}, Part {part_id[:8]}...")
                     except:
                         self.logger.warning(f"NFC queue full, dropping read: {part_id[:8]}")
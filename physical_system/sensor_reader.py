@@ -37,6 +37,11 @@ class SensorReader:
     CORNER1_POS = 21
     CORNER3_POS = 12  # BCM GPIO 12 = Physical Pin 32
 
+    # All Pi-connected input pins, in snapshot order
+    PI_PINS = (STATION1_ENTRY, STATION1_PROCESS, STATION1_EXIT,
+               STATION2_ENTRY, STATION2_PROCESS, STATION2_EXIT,
+               CORNER1_POS, CORNER3_POS)
+
     # Sensor name mapping (GPIO pin to a light barrier name)
     GPIO_TO_BARRIER = {
         17: 'S1_ENTRY',
@@ -54,15 +59,25 @@ class SensorReader:
         'S1_ENTRY': ('station', 1),
         'S1_PROCESS': ('station', 1),
         'S1_EXIT': ('station', 1),
+        'S1_EXIT_CLEAR': ('station', 1),
         'S2_ENTRY': ('station', 2),
         'S2_PROCESS': ('station', 2),
         'S2_EXIT': ('station', 2),
+        'S2_EXIT_CLEAR': ('station', 2),
         'C1_POS': ('corner', 1),
         'C2_POS': ('corner', 2),
         'C3_POS': ('corner', 3),
         'C4_POS': ('corner', 4),
     }
 
+    # Exit pins watch both edges: the falling edge (sensor cleared) is
+    # reported as a *_EXIT_CLEAR barrier so the stations don't have to
+    # guess clearance with a fixed timer
+    EXIT_CLEAR_BARRIERS = {
+        22: ('S1_EXIT_CLEAR', 'station', 1),
+        13: ('S2_EXIT_CLEAR', 'station', 2),
+    }
+
     # MCP23017 pin mapping
     MCP_PIN_MAP = {
         'CORNER1_RET': 0,
@@ -91,13 +106,14 @@ class SensorReader:
         'M2_START': ('conveyor', 2),
     }
 
-    def __init__(self, gpio_queue, mcp_queue, simulation=False):
+    def __init__(self, gpio_queue, mcp_queue, simulation=False, wake_event=None):
         """
         Initialize sensor reader as producer
 
         gpio_queue: Queue for Pi GPIO events
         mcp_queue: Queue for MCP23017 events
         simulation: Run without hardware
+        wake_event: Event to set after enqueueing (wakes the consumer)
         """
         self.logger = logging.getLogger("SensorReader")
         self.simulation = simulation or not HARDWARE_AVAILABLE
@@ -105,6 +121,7 @@ class SensorReader:
         # Event queues
         self.gpio_queue = gpio_queue
         self.mcp_queue = mcp_queue
+        self.wake_event = wake_event
 
         # Debounce tracking
         self.last_trigger_time = {}
@@ -140,9 +157,11 @@ class SensorReader:
                 GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
                 # Add interrupt detection on rising edge (sensor triggers LOW to HIGH)
+                # Exit pins watch both edges so clearance is also interrupt-driven
+                edge = GPIO.BOTH if pin in self.EXIT_CLEAR_BARRIERS else GPIO.RISING
                 GPIO.add_event_detect(
                     pin,
-                    GPIO.RISING,
+                    edge,
                     callback=self._gpio_callback,
                     bouncetime=int(self.debounce_time * 1000)  # Hardware debounce in ms
                 )
@@ -156,6 +175,20 @@ class SensorReader:
             self.logger.error(f"Failed to setup GPIO interrupts: {e}", exc_info=True)
             self.simulation = True
 
+    def snapshot(self):
+        """
+        Read all Pi GPIO inputs in one pass
+
+        Callers can take one snapshot per tick and check several pins
+        from the returned dict instead of issuing independent reads.
+
+        Returns: Dict mapping GPIO pin number to current level (bool)
+        """
+        if self.simulation:
+            return {pin: False for pin in self.PI_PINS}
+
+        return {pin: bool(GPIO.input(pin)) for pin in self.PI_PINS}
+
     def _gpio_callback(self, channel):
         """
         GPIO interrupt callback
@@ -171,8 +204,12 @@ class SensorReader:
                 return  # Ignore bounce
             self.last_trigger_time[channel] = t_gpio
 
-        # Handle dual-purpose sensors (one physical sensor, multiple logical barriers)
-        barriers = self._get_barriers_for_pin(channel)
+        # Falling edge on an exit pin means the sensor just cleared
+        if channel in self.EXIT_CLEAR_BARRIERS and not GPIO.input(channel):
+            barriers = [self.EXIT_CLEAR_BARRIERS[channel]]
+        else:
+            # Handle dual-purpose sensors (one physical sensor, multiple logical barriers)
+            barriers = self._get_barriers_for_pin(channel)
 
         for barrier_id, location_type, location_id in barriers:
             # Create event dictionary
@@ -187,6 +224,8 @@ class SensorReader:
             # Put in queue (non-blocking)
             try:
                 self.gpio_queue.put_nowait(event)
+                if self.wake_event:
+                    self.wake_event.set()
                 self.logger.debug(f"GPIO event: {barrier_id} at {t_gpio:.6f}")
             except:
                 self.logger.warning(f"GPIO queue full, dropping event: {barrier_id}")
@@ -248,9 +287,13 @@ class SensorReader:
 
         while self.mcp_running and not self.mcp_stop_event.is_set():
             try:
-                for name, pin in self.mcp_pins.items():
+                # One bulk register read returns all 16 expander pins,
+                # instead of one I2C transaction per pin
+                raw = self.mcp.gpio
+
+                for name, pin_num in self.MCP_PIN_MAP.items():
                     # Read current state (active low with pull-up)
-                    current_state = not pin.value
+                    current_state = not ((raw >> pin_num) & 1)
                     prev_state = self.mcp_prev_state[name]
 
                     # Detect rising edge (False to True)
@@ -275,6 +318,8 @@ class SensorReader:
                         # Put in queue
                         try:
                             self.mcp_queue.put_nowait(event)
+                            if self.wake_event:
+                                self.wake_event.set()
                             self.logger.debug(f"MCP event: {name} at {t_mcp:.6f}")
                         except:
                             self.logger.warning(f"MCP queue full, dropping event: {name}")
@@ -289,6 +334,29 @@ class SensorReader:
                 self.logger.error(f"Error in MCP poll loop: {e}")
                 time.sleep(0.1)
 
+    def read_corner_pushers(self):
+        """
+        Read all MCP23017 inputs with a single bulk register read
+
+        Returns: Raw 16-bit port value (bit per pin, active low)
+        """
+        if self.simulation or self.mcp is None:
+            return 0xFFFF  # All pins high = nothing triggered (active low)
+        return self.mcp.gpio
+
+    def is_pusher_extended(self, name, snapshot=None):
+        """
+        Bit-test a named MCP sensor against a bulk read
+
+        name: Sensor name from MCP_PIN_MAP (e.g., "CORNER1_EXT")
+        snapshot: Optional raw value from read_corner_pushers() so callers
+                  can poll once and test several pins
+
+        Returns: True if the sensor is triggered
+        """
+        raw = snapshot if snapshot is not None else self.read_corner_pushers()
+        return not ((raw >> self.MCP_PIN_MAP[name]) & 1)
+
     def stop(self):
         """Stop the sensor reader"""
         if self.mcp_running:
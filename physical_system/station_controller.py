@@ -6,7 +6,10 @@ Event driven state machine
 import logging
 import time
 from enum import Enum
-from threading import Timer
+from functools import partial
+from threading import Lock, Timer
+
+from nfc_reader import Part
 
 
 class StationState(Enum):
@@ -27,6 +30,18 @@ class StationController:
     Implements guarded transitions for robust state management
     """
 
+    # Fixed attribute layout: per-event state first, then the bound
+    # helpers the handlers call, then startup-only configuration
+    __slots__ = (
+        'state', 'current_part', 'part', 'entry_timestamp',
+        'process_timer', 'exit_timer', '_exit_lock',
+        'entry_barrier', 'process_barrier', 'exit_barrier',
+        'exit_clear_barrier', '_run_motor', '_stop_motor', '_state_dispatch',
+        'logger', 'station_num', 'station_id', 'motors', 'data_logger',
+        'config', 'process_time', 'motor_speed', 'motor_num',
+        'influx_writer',
+    )
+
     def __init__(self, station_num, motors, data_logger, config):
         """
         Initialize station controller
@@ -57,16 +72,43 @@ class StationController:
 
         self.motor_num = 2 + station_num  # Motor 3 or 4
 
+        # Resolve per-station names and motor calls once, so the event
+        # handlers don't rebuild f-strings or re-dispatch on station_num
+        self.entry_barrier = f'S{station_num}_ENTRY'
+        self.process_barrier = f'S{station_num}_PROCESS'
+        self.exit_barrier = f'S{station_num}_EXIT'
+        self.exit_clear_barrier = f'S{station_num}_EXIT_CLEAR'
+        self._run_motor = partial(motors.set_speed, self.motor_num, self.motor_speed)
+        self._stop_motor = partial(motors.stop, self.motor_num)
+
         # State machine
         self.state = StationState.IDLE
         self.current_part = None
+        self.part = None  # Tracked Part object for the part in the station
         self.entry_timestamp = None
 
         # Processing timer
         self.process_timer = None
 
+        # Fallback timer for exit clearance (normally pre-empted by the
+        # EXIT_CLEAR edge event); the lock makes completion once-only
+        # when the timer and the edge fire together
+        self.exit_timer = None
+        self._exit_lock = Lock()
+
         self.influx_writer = None
 
+        # State dispatch table built once - process_event does a single
+        # dict lookup instead of walking an if/elif chain per event
+        self._state_dispatch = {
+            StationState.IDLE: self._handle_idle,
+            StationState.ENTERING: self._handle_entering,
+            StationState.ADVANCING_TO_PROCESS: self._handle_advancing_to_process,
+            StationState.PROCESSING: self._handle_processing,
+            StationState.ADVANCING_TO_EXIT: self._handle_advancing_to_exit,
+            StationState.EXITING: self._handle_exiting,
+        }
+
         self.logger.info(f"Station {station_num} initialized (passive FSM)")
 
     def _transition_to(self, new_state):
@@ -96,30 +138,12 @@ class StationController:
             'location_id'
         }
         """
-        timestamp = event['timestamp']
-        barrier_id = event['barrier_id']
-        part_id = event['part_id']
-
-        self.logger.debug(f"Event: {barrier_id}, State: {self.state.value}, Part: {part_id}")
-
-        # State-specific event handling
-        if self.state == StationState.IDLE:
-            self._handle_idle(event)
-
-        elif self.state == StationState.ENTERING:
-            self._handle_entering(event)
-
-        elif self.state == StationState.ADVANCING_TO_PROCESS:
-            self._handle_advancing_to_process(event)
-
-        elif self.state == StationState.PROCESSING:
-            self._handle_processing(event)
-
-        elif self.state == StationState.ADVANCING_TO_EXIT:
-            self._handle_advancing_to_exit(event)
+        self.logger.debug(
+            f"Event: {event['barrier_id']}, State: {self.state.value}, Part: {event['part_id']}"
+        )
 
-        elif self.state == StationState.EXITING:
-            self._handle_exiting(event)
+        # State-specific event handling via the dispatch table
+        self._state_dispatch[self.state](event)
 
     def _handle_idle(self, event):
         """Handle events in IDLE state"""
@@ -128,7 +152,7 @@ class StationController:
         timestamp = event['timestamp']
 
         # Only accept ENTRY barrier
-        if barrier_id != f'S{self.station_num}_ENTRY':
+        if barrier_id != self.entry_barrier:
             self.logger.warning(f"Unexpected barrier in IDLE: {barrier_id}")
             return
 
@@ -144,19 +168,21 @@ class StationController:
 
         # Accept part entry
         self.current_part = part_id
+        self.part = Part(part_id)
         self.entry_timestamp = timestamp
 
-        # Log ENTER with timestamp
+        # Log ENTER with timestamp (also records it on the Part)
         self.data_logger.log_event(
             part_id=self.current_part,
             station_id=self.station_id,
-            activity='ENTER'
+            activity='ENTER',
+            part=self.part
         )
 
         self.logger.info(f"Part {part_id[:8]} entered at t={timestamp:.6f}")
 
         # Start motor to advance part
-        self.motors.set_speed(self.motor_num, self.motor_speed)
+        self._run_motor()
 
         # Transition
         self._transition_to(StationState.ENTERING)
@@ -166,14 +192,14 @@ class StationController:
         barrier_id = event['barrier_id']
 
         # Implement low frequency handling to avoid jitter issues
-        if barrier_id == f'S{self.station_num}_ENTRY':
+        if barrier_id == self.entry_barrier:
             # Ignore jitter on entry sensor
             self.logger.debug("Ignoring jitter on ENTRY barrier")
             return
 
         # Accept PROCESS barrier
-        if barrier_id == f'S{self.station_num}_PROCESS':
-            self.motors.stop(self.motor_num)
+        if barrier_id == self.process_barrier:
+            self._stop_motor()
             self.logger.info("Part reached process position")
 
             # Log PROCESS_START activity
@@ -181,7 +207,8 @@ class StationController:
                 part_id=self.current_part,
                 station_id=self.station_id,
                 activity='PROCESS_START',
-                tag='START'
+                tag='START',
+                part=self.part
             )
 
             # Start processing timer
@@ -201,7 +228,7 @@ class StationController:
         barrier_id = event['barrier_id']
 
         # Ignore jitter on process sensor
-        if barrier_id == f'S{self.station_num}_PROCESS':
+        if barrier_id == self.process_barrier:
             self.logger.debug("Ignoring jitter on PROCESS barrier")
             return
 
@@ -225,11 +252,12 @@ class StationController:
             part_id=self.current_part,
             station_id=self.station_id,
             activity='PROCESS_END',
-            tag='FINISH'
+            tag='FINISH',
+            part=self.part
         )
 
         # Start motor to advance to exit
-        self.motors.set_speed(self.motor_num, self.motor_speed)
+        self._run_motor()
 
         # Transition
         self._transition_to(StationState.ADVANCING_TO_EXIT)
@@ -240,18 +268,19 @@ class StationController:
         timestamp = event['timestamp']
 
         # Accept EXIT barrier
-        if barrier_id == f'S{self.station_num}_EXIT':
-            self.motors.stop(self.motor_num)
+        if barrier_id == self.exit_barrier:
+            self._stop_motor()
             self.logger.info("Part reached exit")
 
             # Run motor briefly to clear sensor
-            self.motors.set_speed(self.motor_num, self.motor_speed)
+            self._run_motor()
 
             # Transition
             self._transition_to(StationState.EXITING)
 
-            # Start exit timer (give part time to clear sensor)
-            Timer(1.0, self._exit_complete, args=[timestamp]).start()
+            # Fallback timer in case the clear edge never arrives
+            self.exit_timer = Timer(1.0, self._exit_complete, args=[timestamp])
+            self.exit_timer.start()
             return
 
         # Unexpected barrier
@@ -261,20 +290,38 @@ class StationController:
         """Handle events in EXITING state"""
         barrier_id = event['barrier_id']
 
-        # Accept EXIT barrier going low (part cleared)
-        if barrier_id == f'S{self.station_num}_EXIT':
+        # EXIT sensor cleared (falling edge) - part has left the station
+        if barrier_id == self.exit_clear_barrier:
+            if self.exit_timer and self.exit_timer.is_alive():
+                self.exit_timer.cancel()
+            self._exit_complete(event['timestamp'])
+            return
+
+        # Ignore jitter on the EXIT barrier itself
+        if barrier_id == self.exit_barrier:
             pass
 
     def _exit_complete(self, exit_timestamp):
-        """Called when exit timer expires"""
-        self.motors.stop(self.motor_num)
+        """Called on exit clearance (edge event or fallback timer)"""
+        # The fallback timer (its own thread) and the EXIT_CLEAR edge (CEP
+        # thread) can fire together; the lock serializes them and the state
+        # check makes whichever arrives second a no-op
+        with self._exit_lock:
+            if self.state != StationState.EXITING:
+                return
+            self._do_exit_complete(exit_timestamp)
+
+    def _do_exit_complete(self, exit_timestamp):
+        """Finish the exit: stop motor, log EXIT, reset for the next part"""
+        self._stop_motor()
 
         # Log EXIT with timestamp
         if self.current_part:
             self.data_logger.log_event(
                 part_id=self.current_part,
                 station_id=self.station_id,
-                activity='EXIT'
+                activity='EXIT',
+                part=self.part
             )
 
             cycle_time = exit_timestamp - self.entry_timestamp
@@ -284,6 +331,7 @@ class StationController:
 
         # Reset
         self.current_part = None
+        self.part = None
         self.entry_timestamp = None
         self._transition_to(StationState.IDLE)
 
@@ -294,9 +342,11 @@ class StationController:
         # Cancel any active timers
         if self.process_timer and self.process_timer.is_alive():
             self.process_timer.cancel()
+        if self.exit_timer and self.exit_timer.is_alive():
+            self.exit_timer.cancel()
 
         # Stop motor
-        self.motors.stop(self.motor_num)
+        self._stop_motor()
 
         self.logger.info(f"Station {self.station_num} stopped")
 
@@ -307,4 +357,32 @@ class StationController:
             'state': self.state.value,
             'current_part': self.current_part,
             'entry_timestamp': self.entry_timestamp
-        }
\ No newline at end of file
+        }
+
+
+# Generated per-station subclasses, created once and reused
+_station_classes = {}
+
+
+def make_station_controller(station_num, motors, data_logger, config):
+    """
+    Create a controller specialized for one station
+
+    Builds (and caches) a concrete Station{N}Controller subclass via
+    type(). The station-specific values are resolved in __init__; the
+    subclass gives each station its own specialized type with an empty
+    __slots__ so instances keep the fixed attribute layout.
+
+    Arguments match StationController.__init__
+
+    Returns: StationController instance
+    """
+    cls = _station_classes.get(station_num)
+    if cls is None:
+        cls = type(
+            f"Station{station_num}Controller",
+            (StationController,),
+            {'__slots__': ()}
+        )
+        _station_classes[station_num] = cls
+    return cls(station_num, motors, data_logger, config)
\ No newline at end of file
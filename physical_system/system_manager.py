@@ -8,10 +8,11 @@ import yaml
 import os
 import time
 import queue
+from threading import Event, Thread
 from motor_controller import MotorController
 from sensor_reader import SensorReader
 from nfc_reader import NFCReaderThread
-from station_controller import StationController
+from station_controller import make_station_controller
 from corner_controller import CornerController
 from collision_manager import CollisionManager
 from data_logger import DataLogger
@@ -57,6 +58,10 @@ class SystemManager:
         self.mcp_queue = queue.Queue(maxsize=100)
         self.nfc_queue = queue.Queue(maxsize=20)
 
+        # Shared wake signal: producers set it after enqueueing so the
+        # CEP consumer only runs when there are events to process
+        self.wake_event = Event()
+
         # Initialize Hardware Subsystems
         self.logger.info("Initializing hardware subsystems...")
 
@@ -88,7 +93,8 @@ class SystemManager:
         self.sensors = SensorReader(
             gpio_queue=self.gpio_queue,
             mcp_queue=self.mcp_queue,
-            simulation=simulation
+            simulation=simulation,
+            wake_event=self.wake_event
         )
 
         # NFC reader threads
@@ -96,28 +102,30 @@ class SystemManager:
             reader_num=1,
             station_id=1,
             nfc_queue=self.nfc_queue,
-            simulation=simulation
+            simulation=simulation,
+            wake_event=self.wake_event
         )
 
         self.nfc2_thread = NFCReaderThread(
             reader_num=2,
             station_id=2,
             nfc_queue=self.nfc_queue,
-            simulation=simulation
+            simulation=simulation,
+            wake_event=self.wake_event
         )
 
         # Create Passive FSMs
         self.logger.info("Creating passive FSMs...")
 
-        # Station FSMs
-        self.station1 = StationController(
+        # Station FSMs (specialized per station)
+        self.station1 = make_station_controller(
             station_num=1,
             motors=self.motors,
             data_logger=self.data_logger,
             config=self.config
         )
 
-        self.station2 = StationController(
+        self.station2 = make_station_controller(
             station_num=2,
             motors=self.motors,
             data_logger=self.data_logger,
@@ -166,7 +174,8 @@ class SystemManager:
             fsm_map=self.fsm_map,
             data_logger=self.data_logger,
             config=self.config,
-            simulation=simulation
+            simulation=simulation,
+            wake_event=self.wake_event
         )
 
         # Inject InfluxDB writer into CEP consumer
@@ -326,8 +335,6 @@ class SystemManager:
 
         Publishes KPIs and system status to InfluxDB every 5 seconds
         """
-        import threading
-
         def monitoring_loop():
             self.logger.info("Monitoring thread started")
 
@@ -362,5 +369,5 @@ class SystemManager:
             self.logger.info("Monitoring thread stopped")
 
         self._stop_monitoring = False
-        self._monitoring_thread = threading.Thread(target=monitoring_loop, daemon=True)
+        self._monitoring_thread = Thread(target=monitoring_loop, daemon=True)
         self._monitoring_thread.start()
\ No newline at end of file